@@ -6,7 +6,7 @@ import math
 import os
 from functools import cached_property
 from pathlib import Path
-from typing import Any, Iterator
+from typing import Any, Iterable, Iterator
 
 from igelfs.constants import (
     DIR_OFFSET,
@@ -74,14 +74,22 @@ class Filesystem:
         """Return total number of sections of image."""
         return get_section_of(self.size)
 
+    def _get_valid_sections_with_index(self) -> Iterator[tuple[int, Section]]:
+        """Return generator of valid section indices and sections."""
+        with open(self.path, "rb") as fd:
+            for index in range(self.section_count + 1):
+                fd.seek(get_start_of_section(index))
+                try:
+                    section = Section.from_bytes(fd.read(IGF_SECTION_SIZE))
+                except ValueError:
+                    continue
+                if section:
+                    yield (index, section)
+
     def get_valid_sections(self) -> Iterator[int]:
         """Return generator of valid section indices."""
-        for index in range(self.section_count + 1):
-            try:
-                if self[index]:
-                    yield index
-            except ValueError:
-                continue
+        for index, _ in self._get_valid_sections_with_index():
+            yield index
 
     @cached_property
     def valid_sections(self) -> tuple[int]:
@@ -90,9 +98,9 @@ class Filesystem:
 
     @property
     def sections(self) -> Iterator[Section]:
-        """Return generator of sections."""
-        for index in self.get_valid_sections():
-            yield self[index]
+        """Return generator of sections, reading and parsing each only once."""
+        for _, section in self._get_valid_sections_with_index():
+            yield section
 
     @property
     def partitions(self) -> Iterator[Partition]:
@@ -289,8 +297,9 @@ class Filesystem:
         """Rebuild filesystem to new image at path and return new instance."""
         filesystem = self.new(path, self.section_count - 1)
         filesystem.write_boot_registry(self.boot_registry)
-        for partition_minor in sorted(self.partition_minors_by_directory):
-            sections = self.find_sections_by_directory(partition_minor)
+        directory = self.directory
+        for partition_minor in sorted(directory.partition_minors):
+            sections = self.find_sections_by_directory(partition_minor, directory)
             filesystem.write_partition(sections, partition_minor)
         return filesystem
 
@@ -315,6 +324,29 @@ class Filesystem:
         data = self.get_bytes(offset, IGF_SECTION_SIZE)
         return Section.from_bytes(data)
 
+    def verify_sections(self, indices: Iterable[int] | None = None) -> dict[int, bool]:
+        """
+        Return dictionary of section indices and whether their checksum is valid.
+
+        Sections are read sequentially into a single reused buffer and
+        verified from bytes, without parsing Section instances.
+        If indices is not specified, verify all sections after section #0.
+        Sections which cannot be read completely are not valid.
+        """
+        if indices is None:
+            # Section at index section_count is past the end of the image
+            indices = range(1, self.section_count)
+        result = {}
+        buffer = bytearray(IGF_SECTION_SIZE)
+        with open(self.path, "rb") as fd:
+            for index in indices:
+                fd.seek(get_start_of_section(self._get_section_index(index)))
+                if fd.readinto(buffer) != IGF_SECTION_SIZE:
+                    result[index] = False
+                    continue
+                result[index] = Section.verify_bytes(buffer)
+        return result
+
     def find_sections_by_partition_minor(
         self, partition_minor: int
     ) -> DataModelCollection[Section]:
@@ -326,10 +358,17 @@ class Filesystem:
         )
 
     def find_sections_by_directory(
-        self, partition_minor: int
+        self, partition_minor: int, directory: Directory | None = None
     ) -> DataModelCollection[Section]:
-        """Return Sections with matching partition minor from directory."""
-        fragment = self.directory.find_fragment_by_partition_minor(partition_minor)
+        """
+        Return Sections with matching partition minor from directory.
+
+        If directory is not specified, it is read from the image; callers
+        looking up several partitions should read it once and pass it in.
+        """
+        if directory is None:
+            directory = self.directory
+        fragment = directory.find_fragment_by_partition_minor(partition_minor)
         if not fragment:
             return DataModelCollection()
         sections = DataModelCollection([self[fragment.first_section]])
@@ -367,8 +406,9 @@ class Filesystem:
         path = Path(path).resolve()
         if not path.exists():
             path.mkdir(exist_ok=True)
-        for partition_minor in self.partition_minors_by_directory:
-            sections = self.find_sections_by_directory(partition_minor)
+        directory = self.directory
+        for partition_minor in directory.partition_minors:
+            sections = self.find_sections_by_directory(partition_minor, directory)
             partition = sections[0].partition
             name = f"{partition_minor}"
             if lxos_config:
@@ -384,6 +424,8 @@ class Filesystem:
 
     def get_info(self, lxos_config: LXOSParser | None = None) -> dict[str, Any]:
         """Return information about filesystem."""
+        boot_registry = self.boot_registry
+        directory = self.directory
         info = {
             "path": self.path.as_posix(),
             "size": self.size,
@@ -391,19 +433,19 @@ class Filesystem:
             "boot_registry": {
                 "type": (
                     "legacy"
-                    if isinstance(self.boot_registry, BootRegistryHeaderLegacy)
+                    if isinstance(boot_registry, BootRegistryHeaderLegacy)
                     else "structured"
                 ),
-                "entries": self.boot_registry.get_entries(),
+                "entries": boot_registry.get_entries(),
             },
             "partitions": {
                 partition_minor: {}
-                for partition_minor in sorted(self.partition_minors_by_directory)
+                for partition_minor in sorted(directory.partition_minors)
             },
         }
-        first_sections = self.directory.get_first_sections()
+        first_sections = directory.get_first_sections()
         for partition_minor, partition_info in info["partitions"].items():
-            sections = self.find_sections_by_directory(partition_minor)
+            sections = self.find_sections_by_directory(partition_minor, directory)
             partition_info.update(Section.get_info_of(sections))
             partition_info["first_section"] = first_sections.get(partition_minor)
             if lxos_config and not partition_info["name"]:
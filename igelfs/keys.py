@@ -1,6 +1,7 @@
 """RSA public keys for signature verification."""
 
 import tempfile
+from functools import cache
 
 import rsa
 
@@ -52,10 +53,9 @@ IGEL_PUBLIC_KEYS = [
 ]
 
 
-def get_modulus_from_key(data: bytes | list[int]) -> int:
-    """Get modulus for public RSA key from bytes."""
-    if isinstance(data, list):
-        data = bytes(data)
+@cache
+def _get_modulus_from_key_bytes(data: bytes) -> int:
+    """Get modulus for public RSA key from bytes and cache result."""
     with tempfile.NamedTemporaryFile(delete_on_close=False) as fd:
         fd.write(data)
         fd.close()
@@ -65,3 +65,10 @@ def get_modulus_from_key(data: bytes | list[int]) -> int:
             ).split("=")[1],
             16,
         )
+
+
+def get_modulus_from_key(data: bytes | list[int]) -> int:
+    """Get modulus for public RSA key from bytes."""
+    if isinstance(data, list):
+        data = bytes(data)
+    return _get_modulus_from_key_bytes(data)
@@ -8,6 +8,8 @@ from typing import Any
 class BaseBytesModel(ABC):
     """Abstract base class for handling bytes."""
 
+    __slots__ = ()
+
     @abstractmethod
     def to_bytes(self) -> bytes:
         """Return bytes of all data."""
@@ -46,3 +48,18 @@ class BaseBytesModel(ABC):
                 return data.to_bytes()
             case _:
                 raise TypeError(f"Unknown data type '{type(data)}'")
+
+    @staticmethod
+    def get_converted_size(data: Any, size: int = 1) -> int:
+        """Return size of data when converted to bytes, without converting."""
+        match data:
+            case bytes():
+                return len(data)
+            case int():
+                return size
+            case str():
+                return len(data.encode())
+            case BaseBytesModel():
+                return data.get_actual_size()
+            case _:
+                raise TypeError(f"Unknown data type '{type(data)}'")
@@ -1,17 +1,19 @@
 """Concrete base classes for various data models."""
 
-import io
+import struct
 from collections.abc import Mapping
 from dataclasses import Field, dataclass
+from functools import cache
 from typing import Any, Iterator, get_args, get_origin
 
 from igelfs.models.abc import BaseBytesModel
 from igelfs.models.collections import DataModelCollection
 from igelfs.models.mixins import DataclassMixin
-from igelfs.utils import replace_bytes
 
+INTEGER_FORMATS = {1: "B", 2: "H", 4: "I", 8: "Q"}
 
-@dataclass
+
+@dataclass(slots=True)
 class DataModelMetadata(Mapping, DataclassMixin):
     """
     Dataclass to provide metadata for data models.
@@ -25,18 +27,20 @@ class DataModelMetadata(Mapping, DataclassMixin):
 
     def __getitem__(self, key: str) -> Any:
         """Implement get item method for metadata."""
-        return self.to_dict(shallow=True)[key]
+        if key not in self.__dataclass_fields__:
+            raise KeyError(key)
+        return getattr(self, key)
 
     def __iter__(self) -> Iterator[str]:
         """Implement iterating through metadata."""
-        yield from self.to_dict(shallow=True)
+        return iter(self.__dataclass_fields__)
 
     def __len__(self) -> int:
         """Implement getting length of metadata."""
-        return len(self.to_dict(shallow=True))
+        return len(self.__dataclass_fields__)
 
 
-@dataclass
+@dataclass(slots=True)
 class BaseDataModel(BaseBytesModel, DataclassMixin):
     """Concrete base class for data model."""
 
@@ -44,23 +48,107 @@ class BaseDataModel(BaseBytesModel, DataclassMixin):
         """Implement __len__ data model method."""
         return self.get_actual_size()
 
+    def iter_bytes(self) -> Iterator[bytes]:
+        """Return iterator of bytes for each attribute."""
+        convert_to_bytes = self.convert_to_bytes
+        for name, size in self._get_attribute_names_and_sizes():
+            try:
+                yield convert_to_bytes(getattr(self, name), size)
+            except TypeError:
+                continue
+
+    def _get_struct_values(self) -> list[Any] | None:
+        """
+        Return values of all fields to pack by a Struct, or None if not possible.
+
+        Values are only returned if all are within the limits of their fields,
+        otherwise they are converted individually.
+        """
+        if (limits := self._get_struct_limits()) is None:
+            return None
+        values = [
+            getattr(self, name) for name, _ in self._get_attribute_names_and_sizes()
+        ]
+        for value, (type_, limit) in zip(values, limits):
+            if type_ is bytes:
+                if type(value) is not bytes or len(value) != limit:
+                    return None
+            elif not isinstance(value, int) or not 0 <= value < limit:
+                return None
+        return values
+
     def to_bytes(self) -> bytes:
-        """Return bytes of all data."""
-        with io.BytesIO() as fd:
-            for field in self.get_fields(init_only=False):
-                data = getattr(self, field.name)
-                try:
-                    try:
-                        size = self.get_attribute_size(field.name)
-                    except KeyError:
-                        size = 1
-                    fd.write(self.convert_to_bytes(data, size))
-                except TypeError:
-                    continue
-            fd.seek(0)
-            return fd.read()
+        """
+        Return bytes of all data.
+
+        If model can be packed by a Struct, and all values fit their fields,
+        all fields are packed at once.
+        """
+        if (values := self._get_struct_values()) is not None:
+            struct_ = self._get_struct()
+            assert struct_ is not None
+            return struct_.pack(*values)
+        return b"".join(self.iter_bytes())
+
+    def to_bytes_into(self, buffer: bytearray, offset: int = 0) -> int:
+        """
+        Write bytes of all data into buffer at offset and return offset after data.
+
+        Raises a ValueError if offset is past the end of buffer.
+        Bytes written past the end of buffer are appended in place, so an empty
+        buffer can be filled without joining the bytes of each attribute.
+        If model can be packed by a Struct, all fields are packed at once.
+        """
+        if offset > len(buffer):
+            raise ValueError(
+                f"Offset '{offset}' is past the end of buffer of length '{len(buffer)}'"
+            )
+        if (values := self._get_struct_values()) is not None:
+            struct_ = self._get_struct()
+            assert struct_ is not None
+            end = offset + struct_.size
+            if end > len(buffer):
+                buffer[offset:] = struct_.pack(*values)
+            else:
+                struct_.pack_into(buffer, offset, *values)
+            return end
+        for data in self.iter_bytes():
+            end = offset + len(data)
+            if offset == len(buffer):
+                buffer += data
+            else:
+                buffer[offset:end] = data
+            offset = end
+        return offset
+
+    def get_actual_size(self) -> int:
+        """Return actual size of all data without converting to bytes."""
+        get_converted_size = self.get_converted_size
+        total = 0
+        for name, size in self._get_attribute_names_and_sizes():
+            try:
+                total += get_converted_size(getattr(self, name), size)
+            except TypeError:
+                continue
+        return total
 
     @classmethod
+    @cache
+    def _get_attribute_names_and_sizes(
+        cls: type["BaseDataModel"],
+    ) -> tuple[tuple[str, int], ...]:
+        """Return tuple of names and sizes for all attributes."""
+        attributes = []
+        for field in cls.get_fields(init_only=False):
+            try:
+                size = cls.get_attribute_size(field.name)
+            except KeyError:
+                size = 1
+            attributes.append((field.name, size))
+        return tuple(attributes)
+
+    @classmethod
+    @cache
     def _get_attribute_metadata(
         cls: type["BaseDataModel"],
     ) -> dict[str, Mapping[str, Any]]:
@@ -75,6 +163,7 @@ class BaseDataModel(BaseBytesModel, DataclassMixin):
         return cls._get_attribute_metadata()[name]
 
     @classmethod
+    @cache
     def get_model_size(cls: type["BaseDataModel"]) -> int:
         """Return expected total size of data for model."""
         return sum(
@@ -82,11 +171,13 @@ class BaseDataModel(BaseBytesModel, DataclassMixin):
         )
 
     @classmethod
+    @cache
     def get_attribute_size(cls: type["BaseDataModel"], name: str) -> int:
         """Return size of data for attribute."""
         return cls._get_attribute_metadata_by_name(name)["size"]
 
     @classmethod
+    @cache
     def get_attribute_offset(cls: type["BaseDataModel"], name: str) -> int:
         """Return offset of bytes for attribute."""
         offset = 0
@@ -101,17 +192,81 @@ class BaseDataModel(BaseBytesModel, DataclassMixin):
         """Verify data model integrity."""
         result = self.get_actual_size() == self.get_model_size()
         try:
-            result = result and super().verify()
+            result = result and super(BaseDataModel, self).verify()
         except AttributeError:
             pass
         return result
 
     @classmethod
-    def from_bytes_to_dict(
+    @cache
+    def _get_attribute_slices(
+        cls: type["BaseDataModel"],
+    ) -> tuple[tuple[Field, slice], ...]:
+        """Return tuple of fields and slices of bytes in order of initialisation."""
+        slices = []
+        offset = 0
+        for field in cls.get_fields(init_only=True):
+            size = cls.get_attribute_size(field.name)
+            slices.append((field, slice(offset, offset + size)))
+            offset += size
+        return tuple(slices)
+
+    @classmethod
+    @cache
+    def _get_struct(cls: type["BaseDataModel"]) -> struct.Struct | None:
+        """
+        Return Struct to unpack all init fields at once, or None if not possible.
+
+        Only models with fields of type int (of a native integer size) or bytes,
+        which do not override from_bytes, can be unpacked by a Struct.
+        """
+        from_bytes = getattr(cls.from_bytes, "__func__", None)
+        if from_bytes is not getattr(BaseDataModel.from_bytes, "__func__", None):
+            return None
+        format_ = ["<"]
+        for field, slice_ in cls._get_attribute_slices():
+            size = slice_.stop - slice_.start
+            if field.type == int and size in INTEGER_FORMATS:
+                format_.append(INTEGER_FORMATS[size])
+            elif field.type == bytes:
+                format_.append(f"{size}s")
+            else:
+                return None
+        return struct.Struct("".join(format_))
+
+    @classmethod
+    @cache
+    def _get_struct_limits(
+        cls: type["BaseDataModel"],
+    ) -> tuple[tuple[type, int], ...] | None:
+        """
+        Return tuple of types and limits of all fields to pack by a Struct.
+
+        For bytes fields, the limit is the exact size, as Struct pads or
+        truncates bytes to fit. For int fields, the limit is the exclusive
+        maximum value. Values within these limits cannot fail to pack.
+        Return None if model cannot be packed by a Struct, including if it
+        has fields not set on init.
+        """
+        if cls._get_struct() is None:
+            return None
+        if len(cls.get_fields(init_only=False)) != len(cls.get_fields(init_only=True)):
+            return None
+        return tuple(
+            (
+                (bytes, slice_.stop - slice_.start)
+                if field.type == bytes
+                else (int, 1 << (8 * (slice_.stop - slice_.start)))
+            )
+            for field, slice_ in cls._get_attribute_slices()
+        )
+
+    @classmethod
+    def _split_bytes(
         cls: type["BaseDataModel"], data: bytes, strict: bool = False
-    ) -> dict[str, bytes]:
+    ) -> Iterator[tuple[Field, bytes]]:
         """
-        Return dictionary from bytes.
+        Return iterator of fields and bytes for each attribute.
 
         Raises a ValueError if data is too short to create model.
 
@@ -123,27 +278,31 @@ class BaseDataModel(BaseBytesModel, DataclassMixin):
                 f"Length of data '{len(data)}' "
                 f"is shorter than model size '{cls.get_model_size()}'"
             )
-        model = {}
-        with io.BytesIO(data) as fd:
-            for field in cls.get_fields(init_only=True):
-                data = fd.read(cls.get_attribute_size(field.name))
-                if not data:
-                    raise ValueError(f"Not enough data for model '{cls.__name__}'")
-                model[field.name] = data
-        return model
+        for field, slice_ in cls._get_attribute_slices():
+            value = data[slice_]
+            if not value:
+                raise ValueError(f"Not enough data for model '{cls.__name__}'")
+            yield (field, value)
+
+    @classmethod
+    def from_bytes_to_dict(
+        cls: type["BaseDataModel"], data: bytes, strict: bool = False
+    ) -> dict[str, bytes]:
+        """
+        Return dictionary from bytes.
+
+        Raises a ValueError if data is too short to create model.
+
+        If strict is True, raise ValueError if data length
+        does not meet model size.
+        """
+        return {field.name: value for field, value in cls._split_bytes(data, strict)}
 
     @staticmethod
     def from_field(data: bytes, field: Field) -> Any:
         """Return instance of field type from data."""
         if get_origin(field.type) == DataModelCollection:
-            inner = get_args(field.type)[0]
-            return DataModelCollection(
-                inner.from_bytes(chunk)
-                for chunk in [
-                    data[i : i + inner.get_model_size()]
-                    for i in range(0, len(data), inner.get_model_size())
-                ]
-            )
+            return get_args(field.type)[0].collection_from_bytes(data)
         elif issubclass(field.type, BaseDataModel):
             return field.type.from_bytes(data)
         elif field.type == str:
@@ -153,13 +312,64 @@ class BaseDataModel(BaseBytesModel, DataclassMixin):
         else:
             return field.type(data)
 
+    @classmethod
+    def _get_values_from_bytes(
+        cls: type["BaseDataModel"], data: bytes
+    ) -> tuple[Any, ...]:
+        """Return tuple of values for init fields from bytes."""
+        return tuple(
+            cls.from_field(value, field) for field, value in cls._split_bytes(data)
+        )
+
     @classmethod
     def from_bytes(cls: type["BaseDataModel"], data: bytes) -> "BaseDataModel":
-        """Return data model instance from bytes."""
-        model = cls.from_bytes_to_dict(data)
-        for field in cls.get_fields(init_only=True):
-            model[field.name] = cls.from_field(model[field.name], field)
-        return cls(**model)
+        """
+        Return data model instance from bytes.
+
+        If model can be unpacked by a Struct, all fields are unpacked at once.
+        """
+        if (struct_ := cls._get_struct()) and len(data) >= struct_.size:
+            return cls(*struct_.unpack_from(data))
+        return cls(*cls._get_values_from_bytes(data))
+
+    @classmethod
+    def collection_from_bytes(
+        cls: type["BaseDataModel"], data: bytes
+    ) -> DataModelCollection["BaseDataModel"]:
+        """
+        Return collection of data model instances from consecutive bytes.
+
+        If model can be unpacked by a Struct, all instances are unpacked at once.
+        """
+        size = cls.get_model_size()
+        if (struct_ := cls._get_struct()) and not len(data) % size:
+            return DataModelCollection(
+                cls(*values) for values in struct_.iter_unpack(data)
+            )
+        return DataModelCollection(
+            cls.from_bytes(data[i : i + size]) for i in range(0, len(data), size)
+        )
+
+    @classmethod
+    def collection_from_bytes_at_offset(
+        cls: type["BaseDataModel"], data: bytes, count: int, offset: int = 0
+    ) -> tuple[DataModelCollection["BaseDataModel"], int]:
+        """Return collection of count instances from bytes at offset and offset after."""
+        end = offset + count * cls.get_model_size()
+        if end > len(data):
+            raise ValueError(f"Not enough data for {count} of model '{cls.__name__}'")
+        return (cls.collection_from_bytes(data[offset:end]), end)
+
+    @classmethod
+    def get_attribute_from_bytes(
+        cls: type["BaseDataModel"], data: bytes, name: str, offset: int = 0
+    ) -> Any:
+        """Return value of attribute from bytes of model at offset, without parsing."""
+        start = offset + cls.get_attribute_offset(name)
+        return cls.from_field(
+            data[start : start + cls.get_attribute_size(name)],
+            cls.get_field_by_name(name),
+        )
 
     @classmethod
     def from_bytes_with_remaining(
@@ -168,23 +378,31 @@ class BaseDataModel(BaseBytesModel, DataclassMixin):
         """Return data model instance and remaining data from bytes."""
         return (cls.from_bytes(data), data[cls.get_model_size() :])
 
+    @classmethod
+    def from_bytes_at_offset(
+        cls: type["BaseDataModel"], data: bytes, offset: int = 0
+    ) -> tuple["BaseDataModel", int]:
+        """
+        Return data model instance from bytes at offset and offset after model.
+
+        Only the bytes of the model are sliced, not the remaining data.
+        """
+        size = cls.get_model_size()
+        return (cls.from_bytes(data[offset : offset + size]), offset + size)
+
     @classmethod
     def _get_default_bytes(cls: type["BaseDataModel"]) -> bytes:
         """Return default bytes for new data model."""
-        data = bytes(cls.get_model_size())
-        for name, metadata in cls._get_attribute_metadata().items():
-            value = metadata.get("default")
+        data = bytearray(cls.get_model_size())
+        for field, slice_ in cls._get_attribute_slices():
+            value = field.metadata.get("default")
             if not value:
                 continue
             if callable(value):
                 value = value()
-            offset = cls.get_attribute_offset(name)
-            try:
-                size = cls.get_attribute_size(name)
-            except KeyError:
-                size = 1
-            data = replace_bytes(data, cls.convert_to_bytes(value, size), offset)
-        return data
+            value = cls.convert_to_bytes(value, slice_.stop - slice_.start)
+            data[slice_.start : slice_.start + len(value)] = value
+        return bytes(data)
 
     @classmethod
     def new(cls: type["BaseDataModel"], **kwargs) -> "BaseDataModel":
@@ -210,14 +428,26 @@ class BaseDataModel(BaseBytesModel, DataclassMixin):
 class BaseDataGroup(BaseBytesModel, DataclassMixin):
     """Concrete base class for a dataclass of data models."""
 
+    __slots__ = ()
+
     def to_bytes(self) -> bytes:
         """Return bytes of all data."""
-        with io.BytesIO() as fd:
-            for field in self.get_fields(init_only=False):
-                data = getattr(self, field.name)
-                try:
-                    fd.write(self.convert_to_bytes(data))
-                except TypeError:
-                    continue
-            fd.seek(0)
-            return fd.read()
+        convert_to_bytes = self.convert_to_bytes
+        data = []
+        for field in self.get_fields(init_only=False):
+            try:
+                data.append(convert_to_bytes(getattr(self, field.name)))
+            except TypeError:
+                continue
+        return b"".join(data)
+
+    def get_actual_size(self) -> int:
+        """Return actual size of all data without converting to bytes."""
+        get_converted_size = self.get_converted_size
+        total = 0
+        for field in self.get_fields(init_only=False):
+            try:
+                total += get_converted_size(getattr(self, field.name))
+            except TypeError:
+                continue
+        return total
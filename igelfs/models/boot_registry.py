@@ -1,10 +1,11 @@
 """Data models for the boot registry of a filesystem image."""
 
+import struct
 from abc import abstractmethod
-from collections.abc import Iterable, Iterator
+from collections.abc import Iterable, Iterator, Sequence
 from dataclasses import dataclass, field
 from datetime import datetime
-from functools import partial
+from functools import lru_cache
 from typing import ClassVar
 
 from igelfs.constants import BOOTREG_IDENT, BOOTREG_MAGIC, IGEL_BOOTREG_SIZE
@@ -18,46 +19,17 @@ def generate_boot_id() -> str:
     return dt.strftime("%y%m%d%H%M%S") + dt.strftime("%f").zfill(9)
 
 
-@dataclass
+@dataclass(slots=True)
 class BootRegistryEntry(BaseDataModel):
     """Dataclass to describe each entry of boot registry."""
 
+    STRUCT: ClassVar[struct.Struct] = struct.Struct("<H62s")  # flag, data
+
     flag: int = field(  # first 9 bits next, 1 bit next present, 6 bit len key
         metadata=DataModelMetadata(size=2)
     )
     data: bytes = field(metadata=DataModelMetadata(size=62))
 
-    @property
-    def _flag_bits(self) -> tuple[str, str, str]:
-        """
-        Split flag into tuple of bits.
-
-        9 Bits: Next Block Index
-        1 Bit: Next Block Present
-        6 Bits: Key Length
-        """
-        bits = (
-            bin(
-                int(
-                    self.flag.to_bytes(self.get_attribute_size("flag"), "big").hex(),
-                    base=16,
-                )
-            )
-            .removeprefix("0b")
-            .zfill(16)
-        )
-        return (bits[:9], bits[9:10], bits[10:])
-
-    @property
-    def _flag_values(self) -> tuple[int, int, int]:
-        """
-        Return tuple of integers for flag values.
-
-        Tuple consists of next block index, next block present, key length
-        as integers.
-        """
-        return tuple(map(partial(int, base=2), self._flag_bits))
-
     @classmethod
     def get_flag_from_values(
         cls: type["BootRegistryEntry"],
@@ -66,35 +38,42 @@ class BootRegistryEntry(BaseDataModel):
         key_length: int,
     ) -> int:
         """Return flag integer for specified values."""
-        next_block_index = bin(next_block_index).removeprefix("0b").zfill(9)
-        next_block_present = int(next_block_present)
-        key_length = bin(key_length).removeprefix("0b").zfill(6)
-        return int(f"{next_block_index}{next_block_present}{key_length}", 2)
+        return (next_block_index << 7) | (int(next_block_present) << 6) | key_length
 
     @property
     def next_block_index(self) -> int:
-        """Return index of next block."""
-        return self._flag_values[0]
+        """Return index of next block (first 9 bits of flag)."""
+        return (self.flag >> 7) & 0x1FF
 
     @property
     def next_block_present(self) -> bool:
-        """Return whether next block is present."""
-        return bool(self._flag_values[1])
+        """Return whether next block is present (1 bit of flag)."""
+        return bool((self.flag >> 6) & 0x1)
 
     @property
     def key_length(self) -> int:
-        """Return length of key for entry."""
-        return self._flag_values[2]
+        """Return length of key for entry (last 6 bits of flag)."""
+        return self.flag & 0x3F
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _decode_data(data: bytes, key_length: int) -> tuple[str, str]:
+        """
+        Return tuple of key and value decoded from data and cache result.
+
+        Data is immutable, so results remain valid if the entry is modified.
+        """
+        return (data[:key_length].decode(), data[key_length:].rstrip(b"\x00").decode())
 
     @property
     def key(self) -> str:
         """Return key for entry."""
-        return self.data[: self.key_length].decode()
+        return self._decode_data(self.data, self.key_length)[0]
 
     @property
     def value(self) -> str:
         """Return value for entry."""
-        return self.data[self.key_length :].rstrip(b"\x00").decode()
+        return self._decode_data(self.data, self.key_length)[1]
 
     @value.setter
     def value(self, value: str) -> None:
@@ -104,10 +83,12 @@ class BootRegistryEntry(BaseDataModel):
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class BaseBootRegistryHeader(BaseDataModel):
     """Base class for boot registry header."""
 
+    IDENT: ClassVar[bytes] = BOOTREG_IDENT.encode()
+
     def __post_init__(self) -> None:
         """Verify identity string on initialisation."""
         if self.ident_legacy != BOOTREG_IDENT:
@@ -115,6 +96,18 @@ class BaseBootRegistryHeader(BaseDataModel):
                 f"Unexpected identity string '{self.ident_legacy}' for boot registry"
             )
 
+    @classmethod
+    def from_bytes(
+        cls: type["BaseBootRegistryHeader"], data: bytes
+    ) -> "BaseBootRegistryHeader":
+        """Verify identity bytes before decoding boot registry from bytes."""
+        ident_legacy = data[: cls.get_attribute_size("ident_legacy")]
+        if ident_legacy != cls.IDENT:
+            raise ValueError(
+                f"Unexpected identity string {ident_legacy!r} for boot registry"
+            )
+        return super(BaseBootRegistryHeader, cls).from_bytes(data)
+
     @abstractmethod
     def get_entries(self) -> dict[str, str]:
         """Return dictionary of all boot registry entries."""
@@ -126,7 +119,7 @@ class BaseBootRegistryHeader(BaseDataModel):
         ...
 
 
-@dataclass
+@dataclass(slots=True)
 class BootRegistryHeader(BaseBootRegistryHeader):
     """
     Dataclass to handle boot registry header data.
@@ -134,6 +127,8 @@ class BootRegistryHeader(BaseBootRegistryHeader):
     The boot registry resides in section #0 of the image.
     """
 
+    MAGIC: ClassVar[bytes] = BOOTREG_MAGIC.encode()
+
     ident_legacy: str = field(  # "IGEL BOOTREGISTRY"
         metadata=DataModelMetadata(size=17, default=BOOTREG_IDENT)
     )
@@ -165,12 +160,23 @@ class BootRegistryHeader(BaseBootRegistryHeader):
 
     def __post_init__(self) -> None:
         """Verify magic string on initialisation."""
-        super().__post_init__()
+        super(BootRegistryHeader, self).__post_init__()
         if self.magic != BOOTREG_MAGIC:
             raise ValueError(
                 f"Unexpected magic string '{self.magic}' for boot registry"
             )
 
+    @classmethod
+    def from_bytes(
+        cls: type["BootRegistryHeader"], data: bytes
+    ) -> "BootRegistryHeader":
+        """Verify magic bytes before decoding boot registry from bytes."""
+        offset = cls.get_attribute_offset("magic")
+        magic = data[offset : offset + cls.get_attribute_size("magic")]
+        if magic != cls.MAGIC:
+            raise ValueError(f"Unexpected magic string {magic!r} for boot registry")
+        return super(BootRegistryHeader, cls).from_bytes(data)
+
     def _get_entries_for_key(self, key: str) -> DataModelCollection[BootRegistryEntry]:
         """Return collection of all entries for key."""
         entries = DataModelCollection()
@@ -193,14 +199,77 @@ class BootRegistryHeader(BaseBootRegistryHeader):
                 continue
             yield entry.key
 
+    @staticmethod
+    def _get_bitmap(data: bytes) -> int:
+        """Return integer for bitmap, where bit n represents block n."""
+        return int.from_bytes(data, byteorder="little")
+
+    def get_free_block_count(self) -> int:
+        """Return number of free blocks from bitmap."""
+        return self._get_bitmap(self.free).bit_count()
+
+    def get_used_block_count(self) -> int:
+        """Return number of used blocks from bitmap."""
+        return self._get_bitmap(self.used).bit_count()
+
+    def find_first_free_block(self) -> int | None:
+        """Return index of first free block from bitmap or None if full."""
+        if not (bitmap := self._get_bitmap(self.free)):
+            return None
+        return (bitmap & -bitmap).bit_length() - 1  # lowest set bit
+
+    @staticmethod
+    def _get_entries_from_records(
+        records: Sequence[tuple[int, bytes]],
+    ) -> dict[str, str]:
+        """
+        Return dictionary of boot registry entries from flag and data records.
+
+        Entries are read in a single pass, following the chain of blocks
+        from the first entry with a value for each key.
+
+        Raises a ValueError if a chain of blocks refers to a block which does
+        not exist or was already visited in the chain.
+        """
+        entries: dict[str, str] = {}
+        for index, (flag, data) in enumerate(records):
+            if not flag & 0x3F:  # no key, e.g. empty or continuation block
+                continue
+            key, value = BootRegistryEntry._decode_data(data, flag & 0x3F)
+            if entries.get(key):
+                continue
+            if not value:
+                entries.setdefault(key, "")
+                continue
+            values = [value]
+            chain = {index}
+            while (flag >> 6) & 0x1:
+                next_index = (flag >> 7) & 0x1FF
+                if next_index >= len(records) or next_index in chain:
+                    raise ValueError(
+                        f"Invalid next block index '{next_index}' "
+                        f"for boot registry entry '{key}'"
+                    )
+                chain.add(next_index)
+                flag, data = records[next_index]
+                values.append(BootRegistryEntry._decode_data(data, flag & 0x3F)[1])
+            entries[key] = "".join(values)
+        return entries
+
+    @classmethod
+    def get_entries_from_bytes(
+        cls: type["BootRegistryHeader"], data: bytes
+    ) -> dict[str, str]:
+        """Return dictionary of all boot registry entries from header bytes."""
+        offset = cls.get_attribute_offset("entry")
+        view = memoryview(data)[offset : offset + cls.get_attribute_size("entry")]
+        records = list(BootRegistryEntry.STRUCT.iter_unpack(view))
+        return cls._get_entries_from_records(records)
+
     def get_entries(self) -> dict[str, str]:
         """Return dictionary of all boot registry entries."""
-        entries = {}
-        for key in self._entry_keys:
-            entries[key] = "".join(
-                [entry.value for entry in self._get_entries_for_key(key)]
-            )
-        return entries
+        records = [(entry.flag, entry.data) for entry in self.entry]
+        return self._get_entries_from_records(records)
 
     def _get_next_entry_index(self, exclude: Iterable[int] | None = None) -> int:
         """Return next index for free entry."""
@@ -253,7 +322,7 @@ class BootRegistryHeader(BaseBootRegistryHeader):
         return None
 
 
-@dataclass
+@dataclass(slots=True)
 class BootRegistryHeaderLegacy(BaseBootRegistryHeader):
     """
     Dataclass to handle legacy boot registry header data.
@@ -280,16 +349,20 @@ class BootRegistryHeaderLegacy(BaseBootRegistryHeader):
         return data
 
     def get_entries(self) -> dict[str, str]:
-        """Return dictionary of all boot registry entries."""
+        """
+        Return dictionary of all boot registry entries.
+
+        Entries are split on the first "=", so values may contain "=".
+        Data after the EOF line, such as padding, does not need to be valid.
+        """
         entries = {}
-        for entry in self.entry.decode().splitlines():
-            if not entry:
-                continue
+        for entry in self.entry.decode(errors="surrogateescape").splitlines():
             if entry == self.EOF:
                 break
-            try:
-                key, value = entry.split("=")
-            except ValueError:
+            # Raise for invalid data before the EOF line
+            entry = entry.encode(errors="surrogateescape").decode()
+            key, separator, value = entry.partition("=")
+            if not separator:
                 continue
             entries[key] = value
         return entries
@@ -304,14 +377,16 @@ class BootRegistryHeaderLegacy(BaseBootRegistryHeader):
 class BootRegistryHeaderFactory:
     """Class to handle returning the correct boot registry header model."""
 
-    @staticmethod
-    def is_legacy_boot_registry(data: bytes) -> bool:
+    MAGIC: ClassVar[bytes] = BootRegistryHeader.MAGIC
+    MAGIC_START: ClassVar[int] = BootRegistryHeader.get_attribute_offset("magic")
+    MAGIC_END: ClassVar[int] = MAGIC_START + len(MAGIC)
+
+    @classmethod
+    def is_legacy_boot_registry(
+        cls: type["BootRegistryHeaderFactory"], data: bytes
+    ) -> bool:
         """Return whether bytes represent a legacy boot registry header."""
-        ident_legacy = BootRegistryHeader.get_attribute_size("ident_legacy")
-        magic = BootRegistryHeader.get_attribute_size("magic")
-        if data[ident_legacy : ident_legacy + magic].decode() == BOOTREG_MAGIC:
-            return False
-        return True
+        return data[cls.MAGIC_START : cls.MAGIC_END] != cls.MAGIC
 
     @classmethod
     def from_bytes(
@@ -1,7 +1,9 @@
 """Data models for bootsplash structures."""
 
 import io
+from collections.abc import Iterator
 from dataclasses import dataclass, field
+from typing import ClassVar
 
 from PIL import Image
 
@@ -10,10 +12,12 @@ from igelfs.models.base import BaseDataGroup, BaseDataModel, DataModelMetadata
 from igelfs.models.collections import DataModelCollection
 
 
-@dataclass
+@dataclass(slots=True)
 class BootsplashHeader(BaseDataModel):
     """Dataclass to handle bootsplash header data."""
 
+    MAGIC: ClassVar[bytes] = BOOTSPLASH_MAGIC.encode()
+
     magic: str = field(  # BOOTSPLASH_MAGIC
         metadata=DataModelMetadata(size=14, default=BOOTSPLASH_MAGIC)
     )
@@ -24,8 +28,16 @@ class BootsplashHeader(BaseDataModel):
         if self.magic != BOOTSPLASH_MAGIC:
             raise ValueError(f"Unexpected magic '{self.magic}' for bootsplash header")
 
+    @classmethod
+    def from_bytes(cls: type["BootsplashHeader"], data: bytes) -> "BootsplashHeader":
+        """Verify magic bytes before decoding bootsplash header from bytes."""
+        magic = data[: cls.get_attribute_size("magic")]
+        if magic != cls.MAGIC:
+            raise ValueError(f"Unexpected magic {magic!r} for bootsplash header")
+        return super(BootsplashHeader, cls).from_bytes(data)
+
 
-@dataclass
+@dataclass(slots=True)
 class Bootsplash(BaseDataModel):
     """Dataclass to handle bootsplash data."""
 
@@ -34,7 +46,7 @@ class Bootsplash(BaseDataModel):
     ident: bytes = field(metadata=DataModelMetadata(size=8))
 
 
-@dataclass
+@dataclass(slots=True)
 class BootsplashExtent(BaseDataGroup):
     """
     Dataclass to handle data of a bootsplash partition extent.
@@ -49,21 +61,37 @@ class BootsplashExtent(BaseDataGroup):
     @classmethod
     def from_bytes(cls: type["BootsplashExtent"], data: bytes) -> "BootsplashExtent":
         """Return bootsplash extent model from bytes."""
-        header, data = BootsplashHeader.from_bytes_with_remaining(data)
+        header = BootsplashHeader.from_bytes(data)
+        offset = header.get_model_size()
+        size = Bootsplash.get_model_size()
         splashes = DataModelCollection()
         for _ in range(header.num_splashs):
-            splash, data = Bootsplash.from_bytes_with_remaining(data)
-            splashes.append(splash)
-        return cls(header=header, splashes=splashes, data=data)
+            splashes.append(Bootsplash.from_bytes(data[offset : offset + size]))
+            offset += size
+        return cls(header=header, splashes=splashes, data=data[offset:])
+
+    def _get_data_offset(self) -> int:
+        """Return offset of data relative to start of extent."""
+        return BootsplashHeader.get_model_size() + (
+            len(self.splashes) * Bootsplash.get_model_size()
+        )
+
+    def _iter_image_data(self) -> Iterator[bytes]:
+        """Return iterator of bytes for images."""
+        offset = self._get_data_offset()
+        for splash in self.splashes:
+            start = splash.offset - offset
+            yield self.data[start : start + splash.length]
 
     def _get_image_data(self) -> list[bytes]:
         """Return list of bytes for images."""
-        offset = self.header.get_actual_size() + self.splashes.get_actual_size()
-        return [
-            self.data[splash.offset - offset : splash.offset - offset + splash.length]
-            for splash in self.splashes
-        ]
+        return list(self._iter_image_data())
+
+    def iter_images(self) -> Iterator[Image.Image]:
+        """Return iterator of image instances, opening each image on demand."""
+        for image in self._iter_image_data():
+            yield Image.open(io.BytesIO(image))
 
     def get_images(self) -> list[Image.Image]:
         """Return list of image instances."""
-        return [Image.open(io.BytesIO(image)) for image in self._get_image_data()]
+        return list(self.iter_images())
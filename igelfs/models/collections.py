@@ -1,7 +1,5 @@
 """Helper classes to provide represent collections of data models."""
 
-import io
-
 from igelfs.models.abc import BaseBytesModel
 
 
@@ -10,8 +8,8 @@ class DataModelCollection(BaseBytesModel, list):
 
     def to_bytes(self) -> bytes:
         """Return bytes of all models."""
-        with io.BytesIO() as fd:
-            for model in self:
-                fd.write(model.to_bytes())
-            fd.seek(0)
-            return fd.read()
+        return b"".join(model.to_bytes() for model in self)
+
+    def get_actual_size(self) -> int:
+        """Return actual size of all models without joining their bytes."""
+        return sum(model.get_actual_size() for model in self)
@@ -1,6 +1,9 @@
 """Data models for IGEL filesystem directory."""
 
+import bisect
+from collections.abc import Iterable
 from dataclasses import dataclass, field
+from typing import ClassVar
 
 from igelfs.constants import (
     DIR_MAX_MINORS,
@@ -13,7 +16,7 @@ from igelfs.models.collections import DataModelCollection
 from igelfs.models.mixins import CRCMixin
 
 
-@dataclass
+@dataclass(slots=True)
 class FragmentDescriptor(BaseDataModel):
     """Dataclass to handle fragment descriptors."""
 
@@ -21,7 +24,7 @@ class FragmentDescriptor(BaseDataModel):
     length: int = field(metadata=DataModelMetadata(size=4))  # number of sections
 
 
-@dataclass
+@dataclass(slots=True)
 class PartitionDescriptor(BaseDataModel):
     """Dataclass to handle partition descriptors."""
 
@@ -43,7 +46,7 @@ class PartitionDescriptor(BaseDataModel):
         return PartitionType(self.type)
 
 
-@dataclass
+@dataclass(slots=True)
 class Directory(BaseDataModel, CRCMixin):
     """
     Dataclass to handle directory header data.
@@ -52,6 +55,7 @@ class Directory(BaseDataModel, CRCMixin):
     """
 
     CRC_OFFSET = 4 + 4
+    MAGIC: ClassVar[bytes] = DIRECTORY_MAGIC.encode()
 
     # DIRECTORY_MAGIC
     magic: str = field(metadata=DataModelMetadata(size=4, default=DIRECTORY_MAGIC))
@@ -91,6 +95,14 @@ class Directory(BaseDataModel, CRCMixin):
         if self.magic != DIRECTORY_MAGIC:
             raise ValueError(f"Unexpected magic '{self.magic}' for directory")
 
+    @classmethod
+    def from_bytes(cls: type["Directory"], data: bytes) -> "Directory":
+        """Verify magic bytes before decoding directory from bytes."""
+        magic = data[: cls.get_attribute_size("magic")]
+        if magic != cls.MAGIC:
+            raise ValueError(f"Unexpected magic {magic!r} for directory")
+        return super(Directory, cls).from_bytes(data)
+
     @property
     def free_list(self) -> FragmentDescriptor:
         """Return fragment descriptor for free list."""
@@ -116,7 +128,7 @@ class Directory(BaseDataModel, CRCMixin):
     def partition_minors(self) -> set[int]:
         """Return set of partition minors from directory."""
         partition_minors = {partition.minor for partition in self.partition}
-        partition_minors.remove(0)  # Partition minor 0 does not exist
+        partition_minors.discard(0)  # Partition minor 0 does not exist
         return partition_minors
 
     def find_partition_by_partition_type(
@@ -128,16 +140,28 @@ class Directory(BaseDataModel, CRCMixin):
                 return partition
         return None
 
+    def get_partitions_by_partition_minor(self) -> dict[int, PartitionDescriptor]:
+        """Return mapping of partition minors to existing PartitionDescriptors."""
+        partitions: dict[int, PartitionDescriptor] = {}
+        for partition in self.partition:
+            if partition.n_fragments == 0:
+                continue  # partition does not exist
+            partitions.setdefault(partition.minor, partition)
+        return partitions
+
     def find_partition_by_partition_minor(
         self, partition_minor: int
     ) -> PartitionDescriptor | None:
         """Return PartitionDescriptor with matching partition minor."""
-        for partition in self.partition:
-            if partition.n_fragments == 0:
-                continue  # partition does not exist
-            if partition.minor == partition_minor:
-                return partition
-        return None
+        return next(
+            (
+                partition
+                for partition in self.partition
+                # partition does not exist if it has no fragments
+                if partition.n_fragments and partition.minor == partition_minor
+            ),
+            None,
+        )
 
     def find_fragment_by_partition_minor(
         self, partition_minor: int
@@ -147,11 +171,45 @@ class Directory(BaseDataModel, CRCMixin):
             return None
         return self.fragment[partition.first_fragment]
 
+    def find_fragments_by_sections(
+        self, sections: Iterable[int]
+    ) -> list[FragmentDescriptor | None]:
+        """
+        Return list of FragmentDescriptors containing each section index.
+
+        Fragments are sorted by first section once, then each section is
+        found with a binary search, so bulk queries avoid a linear scan per
+        section. None is returned for sections outside of any fragment.
+        """
+        fragments = sorted(
+            (fragment for fragment in self.fragment if fragment.length),
+            key=lambda fragment: fragment.first_section,
+        )
+        first_sections = [fragment.first_section for fragment in fragments]
+        result: list[FragmentDescriptor | None] = []
+        for section in sections:
+            index = bisect.bisect_right(first_sections, section) - 1
+            if index < 0:
+                result.append(None)
+                continue
+            fragment = fragments[index]
+            if section < fragment.first_section + fragment.length:
+                result.append(fragment)
+            else:
+                result.append(None)
+        return result
+
+    def find_fragment_by_section(self, section: int) -> FragmentDescriptor | None:
+        """Return FragmentDescriptor containing section index."""
+        return self.find_fragments_by_sections((section,))[0]
+
     def get_first_sections(self) -> dict[int, int]:
         """Return mapping of partition minors to first sections."""
+        partitions = self.get_partitions_by_partition_minor()
+        partitions.pop(0, None)  # Partition minor 0 does not exist
         info = {
-            minor: self.find_fragment_by_partition_minor(minor).first_section
-            for minor in sorted(self.partition_minors)
+            minor: self.fragment[partition.first_fragment].first_section
+            for minor, partition in sorted(partitions.items())
         }
         return info
 
@@ -1,7 +1,10 @@
 """Data models for hash data of a partition."""
 
+import bisect
 import hashlib
 from dataclasses import dataclass, field
+from functools import cache
+from typing import ClassVar
 
 import rsa
 
@@ -10,8 +13,21 @@ from igelfs.keys import IGEL_PUBLIC_KEYS
 from igelfs.models.base import BaseDataGroup, BaseDataModel, DataModelMetadata
 from igelfs.models.collections import DataModelCollection
 
+try:  # use OpenSSL for signature verification if available
+    from cryptography.exceptions import InvalidSignature
+    from cryptography.hazmat.primitives.asymmetric.padding import PKCS1v15
+    from cryptography.hazmat.primitives.asymmetric.rsa import (
+        RSAPublicKey,
+        RSAPublicNumbers,
+    )
+    from cryptography.hazmat.primitives.hashes import SHA256
+except ImportError:
+    CRYPTOGRAPHY_AVAILABLE = False
+else:
+    CRYPTOGRAPHY_AVAILABLE = True
+
 
-@dataclass
+@dataclass(slots=True)
 class HashInformation(BaseDataModel):
     """Dataclass to handle hash information data."""
 
@@ -23,7 +39,7 @@ class HashInformation(BaseDataModel):
     hash_size: int = field(metadata=DataModelMetadata(size=2))
 
 
-@dataclass
+@dataclass(slots=True)
 class HashExclude(BaseDataModel):
     """
     Dataclass to handle hash exclude data.
@@ -50,16 +66,79 @@ class HashExclude(BaseDataModel):
     # end address where the exclude area end (only used if repeat is defined)
     end: int = field(metadata=DataModelMetadata(size=8))
 
+    def get_excluded_ranges(self) -> list[range]:
+        """Return list of ranges of excluded indices for hash."""
+        if self.repeat == 0:
+            return [range(self.start, self.start + self.size)]
+        return [
+            range(self.start + offset, self.start + offset + self.size)
+            for offset in range(0, self.end, self.repeat)
+        ]
+
     def get_excluded_indices(self) -> list[int]:
         """Return list of excluded indices for hash."""
-        if self.repeat == 0:
-            return list(range(self.start, self.start + self.size))
         indices = []
-        for offset in range(0, self.end, self.repeat):
-            start = self.start + offset
-            indices.extend(range(start, start + self.size))
+        for range_ in self.get_excluded_ranges():
+            indices.extend(range_)
         return indices
 
+    def apply_mask(self, data: bytearray, offset: int = 0) -> None:
+        """
+        Replace excluded bytes of data with 0x00 in place.
+
+        Offset is the absolute address of the start of data.
+        """
+        for range_ in self.get_excluded_ranges():
+            start = max(range_.start - offset, 0)
+            stop = min(range_.stop - offset, len(data))
+            if start < stop:
+                data[start:stop] = bytes(stop - start)
+
+    @staticmethod
+    def get_excluded_ranges_from_collection(
+        excludes: DataModelCollection["HashExclude"],
+    ) -> list[range]:
+        """
+        Return list of excluded ranges for all hash excludes.
+
+        Ranges are sorted by start and overlapping ranges are merged,
+        so both the starts and stops of the ranges are increasing.
+        """
+        ranges: list[range] = []
+        for range_ in sorted(
+            (
+                range_
+                for exclude in excludes
+                for range_ in exclude.get_excluded_ranges()
+            ),
+            key=lambda range_: range_.start,
+        ):
+            if ranges and range_.start <= ranges[-1].stop:
+                if range_.stop > ranges[-1].stop:
+                    ranges[-1] = range(ranges[-1].start, range_.stop)
+            elif range_:
+                ranges.append(range_)
+        return ranges
+
+    @staticmethod
+    def apply_mask_of_ranges(
+        ranges: list[range], data: bytearray, offset: int = 0
+    ) -> None:
+        """
+        Replace bytes of data in sorted, merged ranges with 0x00 in place.
+
+        Offset is the absolute address of the start of data. Ranges which
+        overlap data are found by binary search, so others are not visited.
+        """
+        first = bisect.bisect_right(ranges, offset, key=lambda range_: range_.stop)
+        last = bisect.bisect_left(
+            ranges, offset + len(data), key=lambda range_: range_.start
+        )
+        for range_ in ranges[first:last]:
+            start = max(range_.start - offset, 0)
+            stop = min(range_.stop - offset, len(data))
+            data[start:stop] = bytes(stop - start)
+
     @staticmethod
     def get_excluded_indices_from_collection(
         excludes: DataModelCollection["HashExclude"],
@@ -71,10 +150,12 @@ class HashExclude(BaseDataModel):
         return indices
 
 
-@dataclass
+@dataclass(slots=True)
 class HashHeader(BaseDataModel):
     """Dataclass to handle hash header data."""
 
+    IDENT: ClassVar[bytes] = HASH_HDR_IDENT.encode()
+
     ident: str = field(  # Ident string "chksum"
         metadata=DataModelMetadata(size=6, default=HASH_HDR_IDENT)
     )
@@ -119,6 +200,14 @@ class HashHeader(BaseDataModel):
         if self.ident != HASH_HDR_IDENT:
             raise ValueError(f"Unexpected ident '{self.ident}' for hash header")
 
+    @classmethod
+    def is_hash_header(cls: type["HashHeader"], data: bytes, offset: int = 0) -> bool:
+        """Return whether data at offset has a valid ident, without parsing."""
+        if len(data) - offset < cls.get_model_size():
+            return False
+        start = offset + cls.get_attribute_offset("ident")
+        return data[start : start + cls.get_attribute_size("ident")] == cls.IDENT
+
     def get_hash_information(self) -> HashInformation:
         """Return HashInformation instance for HashHeader."""
         offset_cache = HashInformation.get_model_size() + (
@@ -135,7 +224,7 @@ class HashHeader(BaseDataModel):
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Hash(BaseDataGroup):
     """Dataclass to store and handle hash-related data models."""
 
@@ -143,34 +232,63 @@ class Hash(BaseDataGroup):
     excludes: DataModelCollection[HashExclude]
     values: bytes
 
+    def _get_hash_offsets(self) -> range:
+        """Return range of offsets for each hash in hash values."""
+        return range(0, self.header.hash_block_size, self.header.hash_bytes)
+
     def get_hashes(self) -> list[bytes]:
         """Return list of hashes as bytes from hash values."""
         return [
-            chunk
-            for chunk in [
-                self.values[i : i + self.header.hash_bytes]
-                for i in range(0, self.header.hash_block_size, self.header.hash_bytes)
-            ]
+            self.values[i : i + self.header.hash_bytes]
+            for i in self._get_hash_offsets()
         ]
 
     def get_hash(self, index: int) -> bytes:
-        """Return hash for specified index."""
-        return self.get_hashes()[index]
+        """Return hash for specified index, without splitting all hash values."""
+        offset = self._get_hash_offsets()[index]
+        return self.values[offset : offset + self.header.hash_bytes]
 
-    def calculate_hash(self, data: bytes) -> bytes:
-        """Return hash of data."""
-        return hashlib.blake2b(data, digest_size=self.header.hash_bytes).digest()
+    @staticmethod
+    @cache
+    def _get_hash_template(digest_size: int) -> hashlib.blake2b:
+        """Return initialised BLAKE2b hash object for digest size to copy from."""
+        return hashlib.blake2b(digest_size=digest_size)
 
-    def verify_signature(self) -> bool:
-        """Verify signature of hash block (excludes + values)."""
-        data = self.excludes.to_bytes() + self.values
-        for public_key in IGEL_PUBLIC_KEYS:
+    def calculate_hash(self, data: bytes | bytearray | memoryview) -> bytes:
+        """Return hash of data, from any object supporting the buffer protocol."""
+        hash_ = self._get_hash_template(self.header.hash_bytes).copy()
+        hash_.update(data)
+        return hash_.digest()
+
+    @staticmethod
+    @cache
+    def _get_cryptography_public_key(public_key: rsa.PublicKey) -> "RSAPublicKey":
+        """Return cryptography RSA public key for rsa public key."""
+        return RSAPublicNumbers(e=public_key.e, n=public_key.n).public_key()
+
+    @classmethod
+    def _verify_signature_with_key(
+        cls: type["Hash"], data: bytes, signature: bytes, public_key: rsa.PublicKey
+    ) -> bool:
+        """Verify SHA-256 signature of data with public key."""
+        if CRYPTOGRAPHY_AVAILABLE:
             try:
-                return (
-                    rsa.verify(data, self.header.signature.rstrip(b"\x00"), public_key)
-                    == "SHA-256"
+                cls._get_cryptography_public_key(public_key).verify(
+                    signature, data, PKCS1v15(), SHA256()
                 )
-            except rsa.VerificationError:
-                pass
-        else:
+            except InvalidSignature:
+                return False
+            return True
+        try:
+            return rsa.verify(data, signature, public_key) == "SHA-256"
+        except rsa.VerificationError:
             return False
+
+    def verify_signature(self) -> bool:
+        """Verify signature of hash block (excludes + values)."""
+        data = self.excludes.to_bytes() + self.values
+        signature = self.header.signature.rstrip(b"\x00")
+        return any(
+            self._verify_signature_with_key(data, signature, public_key)
+            for public_key in IGEL_PUBLIC_KEYS
+        )
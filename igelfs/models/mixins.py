@@ -1,9 +1,14 @@
 """Mixin classes to extend functionality for various data models."""
 
-import zlib
 from dataclasses import Field, asdict, dataclass, fields
+from functools import cache
 from typing import Any, ClassVar, Iterator, Protocol
 
+try:  # use hardware-accelerated CRC32 if available
+    from isal.isal_zlib import crc32  # type: ignore[import-not-found]
+except ImportError:
+    from zlib import crc32
+
 
 class Dataclass(Protocol):
     """Protocol to type for a dataclass."""
@@ -11,26 +16,62 @@ class Dataclass(Protocol):
     __dataclass_fields__: ClassVar[dict[str, Any]]
 
 
-class CRCMixin:
-    """Provide methods to handle CRC checking."""
+class CRCModel(Protocol):
+    """Protocol to type for a data model with a CRC32 checksum."""
 
     CRC_OFFSET: ClassVar[int]
     crc: int
 
+    def iter_bytes(self) -> Iterator[bytes]:
+        """Return iterator of bytes for each attribute."""
+        ...
+
     def get_crc(self) -> int:
-        """Calculate CRC32 of section."""
-        return zlib.crc32(self.to_bytes()[self.CRC_OFFSET :])
+        """Calculate CRC32 of data model."""
+        ...
+
 
-    def verify(self) -> bool:
+class CRCMixin:
+    """Provide methods to handle CRC checking."""
+
+    __slots__ = ()
+
+    CRC_OFFSET: ClassVar[int]
+
+    def get_crc(self: CRCModel) -> int:
+        """
+        Calculate CRC32 of section.
+
+        The checksum is updated with the bytes of each attribute in turn,
+        so the data after CRC_OFFSET is never joined into a single buffer.
+        """
+        crc = 0
+        offset = self.CRC_OFFSET
+        for data in self.iter_bytes():
+            if offset >= len(data):
+                offset -= len(data)
+                continue
+            crc = crc32(memoryview(data)[offset:], crc)
+            offset = 0
+        return crc
+
+    @classmethod
+    def get_crc_from_bytes(
+        cls: type["CRCMixin"], data: bytes | bytearray | memoryview
+    ) -> int:
+        """Calculate CRC32 of serialised model from bytes, without parsing."""
+        return crc32(memoryview(data)[cls.CRC_OFFSET :])
+
+    def verify(self: CRCModel) -> bool:
         """Verify CRC32 checksum."""
         return self.crc == self.get_crc()
 
-    def update_crc(self) -> None:
+    def update_crc(self: CRCModel) -> None:
         """Update CRC32 checksum to current value."""
         self.crc = self.get_crc()
 
 
-@dataclass
+@dataclass(slots=True)
 class DataclassMixin:
     """Provide methods to obtain various data from a dataclass."""
 
@@ -48,16 +89,14 @@ class DataclassMixin:
         return asdict(self)
 
     @classmethod
-    def get_fields(cls: type[Dataclass], init_only: bool = True) -> Iterator[Field]:
+    @cache
+    def get_fields(cls: type[Dataclass], init_only: bool = True) -> tuple[Field, ...]:
         """
-        Return iterator of fields for dataclass.
+        Return tuple of fields for dataclass and cache result.
 
         If init_only, only include fields with parameters in __init__ method.
         """
-        for field in fields(cls):
-            if init_only and not field.init:
-                continue
-            yield field
+        return tuple(field for field in fields(cls) if field.init or not init_only)
 
     @classmethod
     def get_field_by_name(
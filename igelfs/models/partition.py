@@ -7,7 +7,7 @@ from igelfs.models.base import BaseDataGroup, BaseDataModel, DataModelMetadata
 from igelfs.models.collections import DataModelCollection
 
 
-@dataclass
+@dataclass(slots=True)
 class PartitionHeader(BaseDataModel):
     """
     Dataclass to handle partition header data.
@@ -49,28 +49,38 @@ class PartitionHeader(BaseDataModel):
 
     def __post_init__(self) -> None:
         """Handle model-specific data post-initialisation."""
-        size = self.get_model_size() + (
-            self.n_extents * PartitionExtent.get_model_size()
-        )
+        size = self.get_header_length(self.n_extents)
         if self.hdrlen != size:
             raise ValueError(
                 f"Size '{size}' does not match hdrlen '{self.hdrlen}' for partition header"
             )
 
+    # type is a field of this model, so class methods cannot annotate cls with it
+    @classmethod
+    def get_header_length(cls, n_extents: int) -> int:
+        """Return expected length of partition header with number of extents."""
+        return cls.get_model_size() + n_extents * PartitionExtent.get_model_size()
+
+    @classmethod
+    def is_partition_header(cls, data: bytes, offset: int = 0) -> bool:
+        """Return whether data at offset has a valid header, without parsing."""
+        if len(data) - offset < cls.get_model_size():
+            return False
+        hdrlen = cls.get_attribute_from_bytes(data, "hdrlen", offset)
+        n_extents = cls.get_attribute_from_bytes(data, "n_extents", offset)
+        return hdrlen == cls.get_header_length(n_extents)
+
     def get_type(self) -> PartitionType:
         """Return PartitionType from PartitionHeader instance."""
-        type_ = int.from_bytes(
-            self.type.to_bytes(self.get_attribute_size("type"), byteorder="big"),
-            byteorder="little",
-        )
-        return PartitionType(type_ & 0xFF)
+        # Low byte of type with its byte order swapped, i.e. the high byte
+        return PartitionType((self.type >> 8) & 0xFF)
 
     def get_name(self) -> str | None:
         """Return name of partition or None."""
         return self.name.rstrip(b"\x00").decode() or None
 
 
-@dataclass
+@dataclass(slots=True)
 class PartitionExtent(BaseDataModel):
     """Dataclass to handle partition extent data."""
 
@@ -92,7 +102,7 @@ class PartitionExtent(BaseDataModel):
         return self.name.strip(b"\x00").decode()
 
 
-@dataclass
+@dataclass(slots=True)
 class PartitionExtents(BaseDataModel):
     """Dataclass to handle partition extents."""
 
@@ -104,7 +114,7 @@ class PartitionExtents(BaseDataModel):
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class PartitionExtentReadWrite(BaseDataModel):
     """Dataclass to handle partition extent read/write data."""
 
@@ -122,7 +132,7 @@ class PartitionExtentReadWrite(BaseDataModel):
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class Partition(BaseDataGroup):
     """Dataclass to store and handle partition-related data models."""
 
@@ -1,7 +1,6 @@
 """Data models for a section."""
 
 import copy
-import io
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -22,7 +21,7 @@ from igelfs.models.partition import Partition, PartitionExtent, PartitionHeader
 from igelfs.utils import get_start_of_section
 
 
-@dataclass
+@dataclass(slots=True)
 class SectionHeader(BaseDataModel):
     """Dataclass to handle section header data."""
 
@@ -58,7 +57,7 @@ class SectionHeader(BaseDataModel):
             raise ValueError(f"Unexpected magic '{self.magic}' for section header")
 
 
-@dataclass
+@dataclass(slots=True)
 class Section(BaseDataModel, CRCMixin):
     """
     Dataclass to handle section of an image.
@@ -78,42 +77,39 @@ class Section(BaseDataModel, CRCMixin):
 
     def __post_init__(self) -> None:
         """Parse data into optional additional attributes."""
+        offset = 0
         # Partition
-        try:  # Partition header
-            partition_header, self.data = PartitionHeader.from_bytes_with_remaining(
-                self.data
-            )
-        except ValueError:
+        if not PartitionHeader.is_partition_header(self.data, offset):
             self.partition = None
-        else:  # Partition extents
-            partition_extents = DataModelCollection()
-            for _ in range(partition_header.n_extents):
-                extent, self.data = PartitionExtent.from_bytes_with_remaining(self.data)
-                partition_extents.append(extent)
+        else:
+            partition_header, offset = PartitionHeader.from_bytes_at_offset(
+                self.data, offset
+            )
+            partition_extents, offset = PartitionExtent.collection_from_bytes_at_offset(
+                self.data, partition_header.n_extents, offset
+            )
             self.partition = Partition(
                 header=partition_header, extents=partition_extents
             )
 
         # Hashing
-        try:  # Hash header
-            hash_header, self.data = HashHeader.from_bytes_with_remaining(self.data)
-        except (UnicodeDecodeError, ValueError):
+        if not HashHeader.is_hash_header(self.data, offset):
             self.hash = None
-        else:  # Hash excludes
-            hash_excludes = DataModelCollection()
-            for _ in range(hash_header.count_excludes):
-                hash_exclude, self.data = HashExclude.from_bytes_with_remaining(
-                    self.data
-                )
-                hash_excludes.append(hash_exclude)
-            hash_values, self.data = (
-                self.data[: hash_header.hash_block_size],
-                self.data[hash_header.hash_block_size :],
+        else:
+            hash_header, offset = HashHeader.from_bytes_at_offset(self.data, offset)
+            hash_excludes, offset = HashExclude.collection_from_bytes_at_offset(
+                self.data, hash_header.count_excludes, offset
             )
+            hash_values = self.data[offset : offset + hash_header.hash_block_size]
+            offset += len(hash_values)
             self.hash = Hash(
                 header=hash_header, excludes=hash_excludes, values=hash_values
             )
 
+        # Remaining payload, only copied once after all headers are parsed
+        if offset:
+            self.data = self.data[offset:]
+
     @property
     def crc(self) -> int:
         """Return CRC32 checksum from header."""
@@ -124,58 +120,84 @@ class Section(BaseDataModel, CRCMixin):
         """Set CRC32 checksum in header to value."""
         self.header.crc = value
 
+    @classmethod
+    def verify_bytes(
+        cls: type["Section"], data: bytes | bytearray | memoryview
+    ) -> bool:
+        """Verify CRC32 checksum of section from bytes, without parsing."""
+        offset = SectionHeader.get_attribute_offset("crc")
+        crc = int.from_bytes(
+            data[offset : offset + SectionHeader.get_attribute_size("crc")],
+            byteorder="little",
+        )
+        return crc == cls.get_crc_from_bytes(data)
+
     @property
     def end_of_chain(self) -> bool:
         """Return whether this section is the last in the chain."""
         return self.header.next_section == SECTION_END_OF_CHAIN
 
-    def _to_bytes_excluding_by_indices(self, hash_: Hash) -> bytes:
+    def _to_bytes_excluding_by_indices(self, hash_: Hash) -> bytearray:
         """
-        Return bytes of section excluding specified indices.
+        Return bytearray of section excluding specified indices.
 
         Excluded bytes are replaced with 0x00.
         """
-        excludes = HashExclude.get_excluded_indices_from_collection(hash_.excludes)
         offset = get_start_of_section(self.header.section_in_minor)
-        with io.BytesIO() as fd:
-            for index, byte in enumerate([bytes([i]) for i in self.to_bytes()]):
-                if index + offset in excludes:
-                    fd.write(b"\x00")
-                    continue
-                fd.write(byte)
-            fd.seek(0)
-            return fd.read()
-
-    def _to_bytes_excluding_by_range(self, hash_: Hash) -> bytes:
+        data = bytearray()
+        self.to_bytes_into(data)
+        HashExclude.apply_mask_of_ranges(
+            HashExclude.get_excluded_ranges_from_collection(hash_.excludes),
+            data,
+            offset,
+        )
+        return data
+
+    def _to_bytes_excluding_by_range(self, hash_: Hash) -> bytearray:
         """
-        Return bytes of section excluding specified ranges.
+        Return bytearray of section excluding specified ranges.
 
         Excluded bytes are replaced with 0x00.
         This is a port of the original generate_hash method from validate.c.
         """
         position = self.header.section_in_minor * hash_.header.blocksize
-        with io.BytesIO(self.to_bytes()) as fd:
-            for exclude in hash_.excludes:
-                if (
-                    exclude.start >= position
-                    and exclude.start < position + hash_.header.blocksize
-                ):
-                    fd.seek(exclude.start)
-                    fd.write(b"\x00" * exclude.size)
-                    continue
-                if not exclude.repeat or exclude.end < position:
-                    continue
-                repeat = (position / exclude.repeat) * exclude.repeat + exclude.start
-                if repeat <= position and repeat + exclude.size > position:
-                    size = int((repeat + exclude.size) - position)
-                    fd.write(b"\x00" * size)
-                    continue
-                if repeat >= position and repeat < position + hash_.header.blocksize:
-                    fd.seek(int(repeat - position))
-                    fd.write(b"\x00" * exclude.size)
-                    continue
-            fd.seek(0)
-            return fd.read()
+        data = bytearray()
+        self.to_bytes_into(data)
+        cursor = 0
+        for exclude in hash_.excludes:
+            if (
+                exclude.start >= position
+                and exclude.start < position + hash_.header.blocksize
+            ):
+                cursor = self._zero_bytes(data, exclude.start, exclude.size)
+                continue
+            if not exclude.repeat or exclude.end < position:
+                continue
+            repeat = (position // exclude.repeat) * exclude.repeat + exclude.start
+            if repeat <= position and repeat + exclude.size > position:
+                size = (repeat + exclude.size) - position
+                cursor = self._zero_bytes(data, cursor, size)
+                continue
+            if repeat >= position and repeat < position + hash_.header.blocksize:
+                cursor = self._zero_bytes(data, repeat - position, exclude.size)
+                continue
+        return data
+
+    @staticmethod
+    def _zero_bytes(data: bytearray, start: int, size: int) -> int:
+        """
+        Replace size bytes of data from start with 0x00 in place.
+
+        Data is extended if required, like writing to a file-like object,
+        and the position after the replaced bytes is returned.
+        """
+        if size <= 0:
+            return start
+        end = start + size
+        if end > len(data):
+            data.extend(bytes(end - len(data)))
+        data[start:end] = bytes(size)
+        return end
 
     def calculate_hash(self, hash_: Hash, section_in_minor: int | None = None) -> bytes:
         """
@@ -190,8 +212,10 @@ class Section(BaseDataModel, CRCMixin):
         change this value before calculating the hash.
         """
         if section_in_minor is not None:
-            # Create a copy of the section instance
-            section = Section.from_bytes(self.to_bytes())
+            # Create a shallow copy of the section instance with a copied header,
+            # instead of parsing the section again from bytes
+            section = copy.copy(self)
+            section.header = copy.copy(self.header)
             section.header.section_in_minor = section_in_minor
             data = section._to_bytes_excluding_by_range(hash_)
         else:
@@ -281,11 +305,20 @@ class Section(BaseDataModel, CRCMixin):
     def get_payload_of(
         sections: DataModelCollection["Section"], include_extents: bool = False
     ) -> bytes:
-        """Return bytes for all sections, excluding headers."""
-        data = b"".join(section.data for section in sections)
-        if not include_extents:
-            data = data[sections[0].partition.get_extents_length() :]
-        return data
+        """
+        Return bytes for all sections, excluding headers.
+
+        Extents are skipped before joining, so the payload is only copied once.
+        """
+        offset = 0 if include_extents else sections[0].partition.get_extents_length()
+        data = []
+        for section in sections:
+            if offset >= len(section.data):
+                offset -= len(section.data)
+                continue
+            data.append(section.data[offset:] if offset else section.data)
+            offset = 0
+        return b"".join(data)
 
     @classmethod
     def get_extent_of(
@@ -63,9 +63,13 @@ def directory(filesystem: Filesystem) -> Directory:
     return filesystem.directory
 
 
-@pytest.fixture()
+@pytest.fixture(scope="module")
 def section(filesystem: Filesystem) -> Section:
-    """Return random Section instance from filesystem."""
+    """
+    Return random Section instance from filesystem.
+
+    The instance is shared by all tests in a module, so tests must not mutate it.
+    """
     section = None
     while not section:
         try:
@@ -3,7 +3,11 @@
 import pytest
 
 from igelfs.constants import BOOTREG_IDENT, BOOTREG_MAGIC, IGEL_BOOTREG_SIZE
-from igelfs.models import BootRegistryHeader, BootRegistryHeaderLegacy
+from igelfs.models import (
+    BootRegistryEntry,
+    BootRegistryHeader,
+    BootRegistryHeaderLegacy,
+)
 
 
 def test_boot_registry_size(
@@ -74,3 +78,111 @@ def test_boot_registry_set_entries(
     boot_registry.set_entry(key, value)
     assert key in boot_registry.get_entries()
     assert boot_registry.get_entries()[key] == value
+
+
+def test_boot_registry_entry_value() -> None:
+    """Test only trailing null bytes are removed from value of entry."""
+    size = BootRegistryEntry.get_attribute_size("data")
+    entry = BootRegistryEntry.new(
+        flag=BootRegistryEntry.get_flag_from_values(0, False, 3),
+        data=b"key\x00value".ljust(size, b"\x00"),
+    )
+    assert entry.key == "key"
+    assert entry.value == "\x00value"
+
+
+def _new_legacy_boot_registry(data: bytes) -> BootRegistryHeaderLegacy:
+    """Return legacy boot registry header with entry data padded to size."""
+    size = BootRegistryHeaderLegacy.get_attribute_size("entry")
+    return BootRegistryHeaderLegacy.new(entry=data.ljust(size, b"\x00"))
+
+
+@pytest.mark.parametrize(
+    "data,entries",
+    [
+        (b"\na=1\nb=2\nEOF\n", {"a": "1", "b": "2"}),
+        (b"a=1=2\nb==\n", {"a": "1=2", "b": "="}),
+        (b"a=1\r\nb=2\r\nEOF\r\n", {"a": "1", "b": "2"}),
+        (b"a=1\x0bb=2\x0cc=3\x1cd=4\n", {"a": "1", "b": "2", "c": "3", "d": "4"}),
+        (b"a=1\nEOF\nb=2\n", {"a": "1"}),
+        (b"a=1\nnone\n\nEOF\n\xff\xfe", {"a": "1"}),
+    ],
+)
+def test_boot_registry_legacy_get_entries(data: bytes, entries: dict[str, str]) -> None:
+    """Test parsing entries of legacy boot registry."""
+    assert _new_legacy_boot_registry(data).get_entries() == entries
+
+
+def test_boot_registry_legacy_get_entries_invalid() -> None:
+    """Test invalid data before EOF line of legacy boot registry."""
+    with pytest.raises(UnicodeDecodeError):
+        _new_legacy_boot_registry(b"a=\xff\nEOF\n").get_entries()
+
+
+@pytest.mark.parametrize(
+    "free,count,first",
+    [
+        (bytes(64), 0, None),
+        (b"\x00\x02".ljust(64, b"\x00"), 1, 9),
+        (b"\x00\x00\x00\x81".ljust(64, b"\x00"), 2, 24),
+        (bytes(63) + b"\x80", 1, 511),
+        (b"\xff" * 64, 512, 0),
+    ],
+)
+def test_boot_registry_free_blocks(free: bytes, count: int, first: int | None) -> None:
+    """Test free block bitmap of boot registry, where bit n represents block n."""
+    boot_registry = BootRegistryHeader.new(free=free)
+    assert boot_registry.get_free_block_count() == count
+    assert boot_registry.find_first_free_block() == first
+
+
+def test_boot_registry_full() -> None:
+    """Test bitmaps of full boot registry."""
+    boot_registry = BootRegistryHeader.new(free=bytes(64), used=b"\xff" * 64)
+    assert boot_registry.get_used_block_count() == 512
+    assert boot_registry.get_free_block_count() == 0
+    assert boot_registry.find_first_free_block() is None
+
+
+def test_boot_registry_get_entries_from_bytes(
+    boot_registry: BootRegistryHeader | BootRegistryHeaderLegacy,
+) -> None:
+    """Test getting entries of boot registry from bytes matches instance."""
+    if isinstance(boot_registry, BootRegistryHeaderLegacy):
+        pytest.skip("Legacy boot registry header does not have entry blocks")
+    entries = BootRegistryHeader.get_entries_from_bytes(boot_registry.to_bytes())
+    assert entries == boot_registry.get_entries()
+
+
+def test_boot_registry_get_entries_from_bytes_new() -> None:
+    """Test getting entries of new boot registry from bytes, spanning blocks."""
+    boot_registry = BootRegistryHeader.new()
+    entries = {"key": "value", "empty": "", "long": "x" * 200, "last": "y"}
+    for key, value in entries.items():
+        boot_registry.set_entry(key, value)
+    assert boot_registry.get_entries() == {
+        key: value for key, value in entries.items() if value
+    }
+    assert (
+        BootRegistryHeader.get_entries_from_bytes(boot_registry.to_bytes())
+        == boot_registry.get_entries()
+    )
+
+
+@pytest.mark.parametrize("next_block_index", [0, 1, 504, 511])
+def test_boot_registry_get_entries_invalid_chain(next_block_index: int) -> None:
+    """Test chain of blocks referring to itself or a missing block."""
+    boot_registry = BootRegistryHeader.new()
+    size = BootRegistryEntry.get_attribute_size("data")
+    boot_registry.entry[0] = BootRegistryEntry.new(
+        flag=BootRegistryEntry.get_flag_from_values(1, True, 3),
+        data=b"keyvalue".ljust(size, b"\x00"),
+    )
+    boot_registry.entry[1] = BootRegistryEntry.new(
+        flag=BootRegistryEntry.get_flag_from_values(next_block_index, True, 0),
+        data=b"value".ljust(size, b"\x00"),
+    )
+    with pytest.raises(ValueError):
+        boot_registry.get_entries()
+    with pytest.raises(ValueError):
+        BootRegistryHeader.get_entries_from_bytes(boot_registry.to_bytes())
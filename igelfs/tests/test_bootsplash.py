@@ -1,9 +1,14 @@
 """Unit tests for the bootsplash models."""
 
+import io
+from collections.abc import Iterator
+
 import pytest
+from PIL import Image
 
 from igelfs.constants import BOOTSPLASH_MAGIC, ExtentType
 from igelfs.models import (
+    Bootsplash,
     BootsplashExtent,
     BootsplashHeader,
     DataModelCollection,
@@ -28,3 +33,25 @@ def test_bspl_splash_extent(bspl: DataModelCollection[Section]) -> None:
     splash = Section.get_extent_of(bspl, extent)
     extent = BootsplashExtent.from_bytes(splash)
     assert len(extent.get_images()) == len(extent.splashes) == extent.header.num_splashs
+
+
+def test_bootsplash_iter_images() -> None:
+    """Test iterating images of a bootsplash extent, opened on demand."""
+    images = []
+    for size in ((4, 2), (3, 5)):
+        with io.BytesIO() as fd:
+            Image.new("RGB", size).save(fd, format="PNG")
+            images.append(fd.getvalue())
+    header = BootsplashHeader.new(num_splashs=len(images))
+    offset = header.get_model_size() + len(images) * Bootsplash.get_model_size()
+    splashes = DataModelCollection()
+    for image in images:
+        splashes.append(Bootsplash(offset=offset, length=len(image), ident=bytes(8)))
+        offset += len(image)
+    extent = BootsplashExtent.from_bytes(
+        header.to_bytes() + splashes.to_bytes() + b"".join(images)
+    )
+    iterator = extent.iter_images()
+    assert isinstance(iterator, Iterator)
+    assert [image.size for image in iterator] == [(4, 2), (3, 5)]
+    assert [image.size for image in extent.get_images()] == [(4, 2), (3, 5)]
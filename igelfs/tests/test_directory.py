@@ -23,3 +23,20 @@ def test_directory_free_list(directory: Directory) -> None:
 def test_directory_n_fragments(directory: Directory) -> None:
     """Test number of fragments matches directory information."""
     assert directory.n_fragments == directory._get_n_fragments()
+
+
+def test_directory_find_fragments_by_sections() -> None:
+    """Test finding fragments containing sections by binary search."""
+    directory = Directory.new()
+    first, second = directory.fragment[1], directory.fragment[2]
+    # Fragments are not stored in order of first section
+    second.first_section, second.length = 10, 5  # sections 10-14
+    first.first_section, first.length = 20, 3  # sections 20-22
+    sections = (9, 10, 14, 15, 19, 20, 22, 23, 100)
+    expected = (None, second, second, None, None, first, first, None, None)
+    for fragment, expected_fragment in zip(
+        directory.find_fragments_by_sections(sections), expected, strict=True
+    ):
+        assert fragment is expected_fragment
+    for section, expected_fragment in zip(sections, expected):
+        assert directory.find_fragment_by_section(section) is expected_fragment
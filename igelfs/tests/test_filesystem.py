@@ -1,11 +1,34 @@
 """Unit tests for the filesystem class."""
 
+from pathlib import Path
+
 import pytest
 
 from igelfs import Filesystem
+from igelfs.constants import IGF_SECTION_SIZE
+from igelfs.utils import get_start_of_section
 
 
 @pytest.mark.slow
 def test_filesystem_partition_minors(filesystem: Filesystem) -> None:
     """Test getting partition minors from filesystem."""
     assert filesystem.partition_minors == filesystem.partition_minors_by_directory
+
+
+def test_filesystem_verify_sections(tmp_path: Path) -> None:
+    """Test verifying checksums of sections from a new image."""
+    filesystem = Filesystem.new(tmp_path / "igf.img", 2)
+    section = Filesystem.create_partition_from_bytes(b"data")[0]
+    section.update_crc()
+    filesystem.write_bytes(section.to_bytes(), get_start_of_section(2))
+    assert filesystem.verify_sections() == {1: False, 2: True}
+    assert filesystem.verify_sections([2, 3]) == {2: True, 3: False}
+
+
+def test_filesystem_verify_sections_truncated(tmp_path: Path) -> None:
+    """Test sections which cannot be read completely are not valid."""
+    path = tmp_path / "igf.img"
+    path.write_bytes(b"\x01" * (IGF_SECTION_SIZE * 3 + 1))
+    filesystem = Filesystem(path)
+    assert filesystem.verify_sections() == {1: False, 2: False}
+    assert filesystem.verify_sections([3]) == {3: False}
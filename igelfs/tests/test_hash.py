@@ -1,7 +1,7 @@
 """Unit tests for the hash block."""
 
 from igelfs.constants import HASH_HDR_IDENT
-from igelfs.models import Hash
+from igelfs.models import Hash, HashExclude
 
 
 def test_hash_header_verify(hash_: Hash) -> None:
@@ -37,3 +37,12 @@ def test_hash_values_size(hash_: Hash) -> None:
         == hash_.header.hash_block_size
         == len(hash_.values)
     )
+
+
+def test_hash_excludes_ranges(hash_: Hash) -> None:
+    """Test merged ranges of hash excludes match excluded indices."""
+    ranges = HashExclude.get_excluded_ranges_from_collection(hash_.excludes)
+    assert all(a.stop < b.start for a, b in zip(ranges, ranges[1:]))
+    assert {index for range_ in ranges for index in range_} == set(
+        HashExclude.get_excluded_indices_from_collection(hash_.excludes)
+    )
@@ -5,8 +5,11 @@ import pytest
 from igelfs import models
 from igelfs.models.base import BaseDataModel
 
-data_models = filter(
-    lambda cls: issubclass(cls, BaseDataModel), map(models.__dict__.get, models.__all__)
+data_models = tuple(
+    filter(
+        lambda cls: issubclass(cls, BaseDataModel),
+        map(models.__dict__.get, models.__all__),
+    )
 )
 
 
@@ -17,3 +20,21 @@ def test_models_new(model: BaseDataModel) -> None:
     assert isinstance(instance, model)
     assert instance.get_actual_size() == model.get_model_size()
     assert model.from_bytes(instance.to_bytes()) == instance
+
+
+@pytest.mark.parametrize("model", data_models)
+def test_models_to_bytes_into(model: BaseDataModel) -> None:
+    """Test writing bytes of model into a buffer."""
+    instance = model.new()
+    data = instance.to_bytes()
+    buffer = bytearray()
+    assert instance.to_bytes_into(buffer) == len(data)
+    assert buffer == data
+    buffer = bytearray(b"ab" * len(data))
+    assert instance.to_bytes_into(buffer, 1) == len(data) + 1
+    assert buffer == b"a" + data + (b"ab" * len(data))[len(data) + 1 :]
+    buffer = bytearray(b"ab")
+    assert instance.to_bytes_into(buffer, 1) == len(data) + 1
+    assert buffer == b"a" + data
+    with pytest.raises(ValueError):
+        instance.to_bytes_into(bytearray(b"ab"), 3)
@@ -3,8 +3,20 @@
 import magic
 import pytest
 
-from igelfs.constants import IGF_SECT_DATA_LEN, IGF_SECT_HDR_LEN, ExtentType
-from igelfs.models import DataModelCollection, Section
+from igelfs.constants import (
+    IGF_SECT_DATA_LEN,
+    IGF_SECT_HDR_LEN,
+    IGF_SECTION_SIZE,
+    ExtentType,
+)
+from igelfs.models import (
+    DataModelCollection,
+    Hash,
+    HashExclude,
+    HashHeader,
+    Section,
+    SectionHeader,
+)
 
 
 def test_section_size(section: Section) -> None:
@@ -14,6 +26,13 @@ def test_section_size(section: Section) -> None:
     assert size == IGF_SECT_HDR_LEN + IGF_SECT_DATA_LEN
 
 
+def test_section_to_bytes_into(section: Section) -> None:
+    """Test writing bytes of section into a buffer."""
+    buffer = bytearray()
+    assert section.to_bytes_into(buffer) == section.get_actual_size()
+    assert buffer == section.to_bytes()
+
+
 def test_section_header_size(section: Section) -> None:
     """Test size of section header."""
     size = section.header.get_actual_size()
@@ -30,18 +49,19 @@ def test_section_data_size(section: Section) -> None:
 def test_section_verify(section: Section) -> None:
     """Test verification of section."""
     assert section.verify()
+    assert Section.verify_bytes(section.to_bytes())
 
 
 def test_section_payload(sys: DataModelCollection[Section]) -> None:
     """Test getting payloads of section."""
     data = Section.get_payload_of(sys)  # sys partition has kernel extent
     data_with_extents = Section.get_payload_of(sys, include_extents=True)
-    extents = [
-        Section.get_extent_of(sys, extent) for extent in sys[0].partition.extents
-    ]
+    extents_length = sum(
+        len(Section.get_extent_of(sys, extent)) for extent in sys[0].partition.extents
+    )
     # Legacy filesystems (<= OS 10) do not have hash blocks
     hash_size = sys[0].hash.get_actual_size() if sys[0].hash else 0
-    assert len(data) + sum(len(extent) for extent in extents) == len(data_with_extents)
+    assert len(data) + extents_length == len(data_with_extents)
     assert (  # start of actual payload
         sys[0].partition.get_actual_size()
         + hash_size
@@ -60,3 +80,24 @@ def test_sys_kernel_extent(sys: DataModelCollection[Section]) -> None:
         pytest.skip("System partition does not have a kernel extent")
     kernel = Section.get_extent_of(sys, extent)
     assert "Linux kernel" in magic.from_buffer(kernel)
+
+
+@pytest.mark.parametrize("section_in_minor", range(4))
+def test_section_hash_exclude_repeat(section_in_minor: int) -> None:
+    """Test repeating hash exclude is zeroed only in sections it falls in."""
+    header = HashHeader.new()
+    header.blocksize = IGF_SECTION_SIZE
+    exclude = HashExclude(
+        start=1000, size=16, repeat=IGF_SECTION_SIZE * 2, end=IGF_SECTION_SIZE * 8
+    )
+    hash_ = Hash(header=header, excludes=DataModelCollection([exclude]), values=b"")
+    section = Section.from_bytes(
+        SectionHeader.new().to_bytes() + b"\xff" * IGF_SECT_DATA_LEN
+    )
+    section.header.section_in_minor = section_in_minor
+    data = section.to_bytes()
+    masked = section._to_bytes_excluding_by_range(hash_)
+    zeroed = [index for index, (a, b) in enumerate(zip(data, masked)) if a != b]
+    # exclude repeats every other section, at the same offset in the section
+    assert zeroed == (list(range(1000, 1016)) if section_in_minor % 2 == 0 else [])
+    assert masked == section._to_bytes_excluding_by_indices(hash_)
@@ -5,6 +5,8 @@ import subprocess
 
 from igelfs.constants import IGF_SECTION_SHIFT, IGF_SECTION_SIZE
 
+_SECTION_OFFSET_MASK = IGF_SECTION_SIZE - 1
+
 
 def get_start_of_section(index: int) -> int:
     """Return offset for start of section relative to image."""
@@ -18,7 +20,7 @@ def get_section_of(offset: int) -> int:
 
 def get_offset_of(offset: int) -> int:
     """Return offset relative to start of section for specified offset."""
-    return offset & (IGF_SECTION_SIZE - 1)
+    return offset & _SECTION_OFFSET_MASK
 
 
 def replace_bytes(
@@ -38,15 +40,12 @@ def replace_bytes(
         return fd.read()
 
 
-def run_process(*args, **kwargs) -> str:
+def run_process(
+    *args, capture_output: bool = True, check: bool = True, **kwargs
+) -> str:
     """Run process and return stdout or raise exception if failed."""
     return (
-        subprocess.run(
-            *args,
-            capture_output=kwargs.pop("capture_output", True),
-            check=kwargs.pop("check", True),
-            **kwargs,
-        )
+        subprocess.run(*args, capture_output=capture_output, check=check, **kwargs)
         .stdout.strip()
         .decode()
     )